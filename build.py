@@ -32,6 +32,7 @@ requires_python = ">=3.4"
 def set_properties(project):
     project.depends_on('jinja2')
     project.depends_on('tqdm')
+    project.depends_on('msgpack')
     project.depends_on('opencv-python')
     project.depends_on('docopt')
     project.depends_on('Pillow')
@@ -79,7 +79,7 @@ class Custom20BNJsonVideoAdapter(AbstractDatasetAdapter,
     def __init__(self, json_file, folder, output_folder,
                  shuffle=False, frame_size=-1, frame_rate=8,
                  shm_dir_path='/dev/shm', label_name='template',
-                 remove_duplicate_ids=False):
+                 remove_duplicate_ids=False, keep_jpg=False):
         self.json_file = json_file
         if json_file.endswith('.json.gz'):
             self.data = self.read_gz_json(json_file)
@@ -95,6 +95,7 @@ class Custom20BNJsonVideoAdapter(AbstractDatasetAdapter,
         self.frame_size = int(frame_size)
         self.frame_rate = int(frame_rate)
         self.shm_dir_path = shm_dir_path
+        self.keep_jpg = keep_jpg
         self.all_meta = self.get_meta()
         if remove_duplicate_ids:
             self.all_meta = remove_entries_with_duplicate_ids(
@@ -129,7 +130,8 @@ class Custom20BNJsonVideoAdapter(AbstractDatasetAdapter,
             with temp_dir_for_bursting(self.shm_dir_path) as temp_burst_dir:
                 frame_paths = burst_video_into_frames(
                     video_path, temp_burst_dir, frame_rate=self.frame_rate)
-                frames = list(resize_images(frame_paths, self.frame_size))
+                frames = list(resize_images(frame_paths, self.frame_size,
+                                            keep_jpg=self.keep_jpg))
             result = {'meta': meta,
                       'frames': frames,
                       'id': meta['id']}
@@ -145,7 +147,7 @@ class Custom20BNCsvWebmAdapter(AbstractDatasetAdapter,
     def __init__(self, csv_file, folder, output_folder,
                  shuffle=False, frame_size=-1, frame_rate=12,
                  shm_dir_path='/dev/shm', label_name='label',
-                 remove_duplicate_ids=False):
+                 remove_duplicate_ids=False, keep_jpg=False):
         self.data = self.read_csv(csv_file)
         self.label_name = label_name
         self.output_folder = output_folder
@@ -155,6 +157,7 @@ class Custom20BNCsvWebmAdapter(AbstractDatasetAdapter,
         self.frame_size = int(frame_size)
         self.frame_rate = int(frame_rate)
         self.shm_dir_path = shm_dir_path
+        self.keep_jpg = keep_jpg
         self.all_meta = self.get_meta()
         if remove_duplicate_ids:
             self.all_meta = remove_entries_with_duplicate_ids(
@@ -196,7 +199,8 @@ class Custom20BNCsvWebmAdapter(AbstractDatasetAdapter,
             with temp_dir_for_bursting(self.shm_dir_path) as temp_burst_dir:
                 frame_paths = burst_video_into_frames(
                     video_path, temp_burst_dir, frame_rate=self.frame_rate)
-                frames = list(resize_images(frame_paths, self.frame_size))
+                frames = list(resize_images(frame_paths, self.frame_size,
+                                            keep_jpg=self.keep_jpg))
             result = {'meta': meta,
                       'frames': frames,
                       'id': meta['id']}
@@ -210,7 +214,8 @@ class Custom20BNCsvJpegAdapter(AbstractDatasetAdapter,
     """ Adapter for 20BN datasets specified by CSV file and JPEG frames. """
 
     def __init__(self, csv_file, folder, output_folder,
-                 shuffle=False, frame_size=-1, shm_dir_path='/dev/shm'):
+                 shuffle=False, frame_size=-1, shm_dir_path='/dev/shm',
+                 keep_jpg=False):
         self.data = self.read_csv(csv_file)
         self.output_folder = output_folder
         self.labels2idx = self.create_label2idx_dict('label')
@@ -218,6 +223,7 @@ class Custom20BNCsvJpegAdapter(AbstractDatasetAdapter,
         self.shuffle = shuffle
         self.frame_size = frame_size
         self.shm_dir_path = shm_dir_path
+        self.keep_jpg = keep_jpg
         self.all_meta = self.get_meta()
         if self.shuffle:
             random.shuffle(self.all_meta)
@@ -244,7 +250,8 @@ class Custom20BNCsvJpegAdapter(AbstractDatasetAdapter,
         for meta in self.all_meta[slice_element]:
             video_folder = os.path.join(self.folder, str(meta['id']))
             frame_paths = find_images_in_folder(video_folder, formats=['jpg'])
-            frames = list(resize_images(frame_paths, self.frame_size))
+            frames = list(resize_images(frame_paths, self.frame_size,
+                                        keep_jpg=self.keep_jpg))
             result = {'meta': meta,
                       'frames': frames,
                       'id': meta['id']}
@@ -407,13 +414,15 @@ class ActivitynetAdapter(AbstractDatasetAdapter):
 
     def __init__(self, json_file, folder,
                  shuffle=False, frame_size=-1,
-                 shm_dir_path='/dev/shm', phase='training'):
+                 shm_dir_path='/dev/shm', phase='training',
+                 keep_jpg=False):
         self.json_file = json_file
         self.json_storage = self.read_json(json_file)
         self.folder = folder
         self.set_video_storage(phase)
         self.frame_size = frame_size
         self.shm_dir_path = shm_dir_path
+        self.keep_jpg = keep_jpg
         if shuffle:
             random.shuffle(self.vid_storage)
 
@@ -438,7 +447,8 @@ class ActivitynetAdapter(AbstractDatasetAdapter):
         with temp_dir_for_bursting(self.shm_dir_path) as temp_burst_dir:
             frame_paths = burst_video_into_frames(vid_file,
                                                   temp_burst_dir)
-            frames = list(resize_images(frame_paths, self.frame_size))
+            frames = list(resize_images(frame_paths, self.frame_size,
+                                        keep_jpg=self.keep_jpg))
         return frames
 
     def iter_data(self, slice_element=None):
@@ -468,13 +478,14 @@ class KineticsAdapter(AbstractDatasetAdapter):
     """
     def __init__(self, json_file, folder,
                  shuffle=False, frame_size=-1,
-                 shm_dir_path='/dev/shm'):
+                 shm_dir_path='/dev/shm', keep_jpg=False):
         self.json_file = json_file
         self.json_storage = self.read_json(json_file)
         self.folder = folder
         self.set_video_storage()
         self.frame_size = frame_size
         self.shm_dir_path = shm_dir_path
+        self.keep_jpg = keep_jpg
         if shuffle:
             random.shuffle(self.vid_storage)
 
@@ -496,7 +507,8 @@ class KineticsAdapter(AbstractDatasetAdapter):
         with temp_dir_for_bursting(self.shm_dir_path) as temp_burst_dir:
             frame_paths = burst_video_into_frames(vid_file,
                                                   temp_burst_dir)
-            frames = list(resize_images(frame_paths, self.frame_size))
+            frames = list(resize_images(frame_paths, self.frame_size,
+                                        keep_jpg=self.keep_jpg))
         return frames
 
     def iter_data(self, slice_element=None):
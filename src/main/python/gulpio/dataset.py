@@ -63,8 +63,7 @@ class GulpVideoDataset(object):
 
         target_name = item_info['meta_data'][0]['label']
         target_idx = self.label2idx[target_name]
-        frames = item_info['frame_info']
-        num_frames = len(frames)
+        num_frames = len(item_info['frame_info']['loc'])
         # set number of necessary frames
         if self.num_frames > -1:
             num_frames_necessary = self.num_frames * self.step_size
@@ -146,8 +145,7 @@ class GulpImageDataset(object):
 
         target_name = item_info['meta_data'][0]['label']
         target_idx = self.label2idx[target_name]
-        img_rec = item_info['frame_info']
-        assert len(img_rec) == 1
+        assert len(item_info['frame_info']['loc']) == 1
         # set number of necessary frames
         img, meta = self.gd[item_id]
         img = img[0]
@@ -6,15 +6,44 @@ import cv2
 import pickle
 import json
 import glob
+import inspect
+import mmap
+import msgpack
 import numpy as np
 
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
 from contextlib import contextmanager
 from collections import namedtuple, OrderedDict
 
 from tqdm import tqdm
 
+try:
+    from turbojpeg import (TurboJPEG,
+                           TJPF_BGR,
+                           TJPF_RGB,
+                           TJPF_GRAY,
+                           TJSAMP_420,
+                           TJSAMP_GRAY,
+                           )
+except ImportError:  # pragma: no cover
+    TurboJPEG = None
+
+# PyTurboJPEG < 2.0 can not decode into a given array
+_TJ_DECODE_DST = (TurboJPEG is not None and
+                  'dst' in inspect.signature(TurboJPEG.decode).parameters)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+# torchvision's nvJPEG decoder, resolved on first use by
+# `load_cuda_jpeg_decoder` since importing torch is slow
+_cuda_jpeg_decoder = None
+_cuda_jpeg_decoder_resolved = False
+
 
 ImgInfo = namedtuple('ImgInfo', ['loc',
                                  'pad',
@@ -54,8 +83,113 @@ class JSONSerializer(AbstractSerializer):
             json.dump(thing, file_pointer)
 
 
+# msgpack extension type code of numpy arrays
+_ND_EXT_CODE = 1
+
+
+def _pack_numpy(obj):
+    if isinstance(obj, np.ndarray):
+        return msgpack.ExtType(_ND_EXT_CODE, msgpack.packb(
+            [obj.dtype.str, list(obj.shape),
+             np.ascontiguousarray(obj).tobytes()], use_bin_type=True))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError("Can not serialize object of type {}".format(type(obj)))
+
+
+def _unpack_numpy(code, data):
+    if code == _ND_EXT_CODE:
+        dtype, shape, buffer_ = msgpack.unpackb(data, raw=False)
+        return np.frombuffer(buffer_, dtype=dtype).reshape(shape)
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackSerializer(AbstractSerializer):
+    """ Binary serializer that also handles numpy arrays and scalars.
+
+    Meta files written in JSON by older versions are still loaded. Unlike
+    JSON, keys that are not strings are kept as they are.
+
+    """
+
+    def load(self, file_name):
+        with open(file_name, 'rb') as file_pointer:
+            content = file_pointer.read()
+        if content[:1] == b'{':
+            return json.loads(content.decode('utf-8'),
+                              object_pairs_hook=OrderedDict)
+        # only the arrays need a hook, nested maps stay plain (ordered) dicts
+        return OrderedDict(msgpack.unpackb(content, raw=False,
+                                           strict_map_key=False,
+                                           ext_hook=_unpack_numpy))
+
+    def dump(self, thing, file_name):
+        with open(file_name, 'wb') as file_pointer:
+            file_pointer.write(msgpack.packb(thing, use_bin_type=True,
+                                             default=_pack_numpy))
+
+
 pickle_serializer = PickleSerializer()
 json_serializer = JSONSerializer()
+msgpack_serializer = MsgpackSerializer()
+
+JPEG_QUALITY = 95
+
+# zero bytes used to pad records to a multiple of four bytes, by pad length
+_PAD = (b'', b'\0', b'\0\0', b'\0\0\0')
+
+# the chunk id in the file names 'data_<id>.gulp' and 'meta_<id>.gmeta'
+# (or 'data_<id>.arrow' for an ArrowGulpChunk)
+_ID_RE = re.compile(r'\d+')
+
+
+# os.writev is not available on Windows
+_HAS_WRITEV = hasattr(os, 'writev')
+
+
+def writev_all(fd, buffers):
+    """ Write all buffers to the file descriptor with a single `os.writev`
+    call, falling back to plain writes for the rest of a partial write. """
+    total = sum(len(buffer_) for buffer_ in buffers)
+    written = os.writev(fd, buffers)
+    if written < total:  # pragma: no cover
+        rest = b''.join(buffers)[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+    return total
+
+
+def load_turbojpeg():
+    """ Return a TurboJPEG instance, or None if PyTurboJPEG or the
+    libjpeg-turbo shared library is not available. """
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError):  # pragma: no cover
+        return None
+
+
+def load_cuda_jpeg_decoder():
+    """ Return torchvision's batched nvJPEG `decode_jpeg`, or None if torch,
+    torchvision or a CUDA device is not available. The result is resolved
+    once per process. """
+    global _cuda_jpeg_decoder, _cuda_jpeg_decoder_resolved
+    if not _cuda_jpeg_decoder_resolved:
+        _cuda_jpeg_decoder = _find_cuda_jpeg_decoder()
+        _cuda_jpeg_decoder_resolved = True
+    return _cuda_jpeg_decoder
+
+
+def _find_cuda_jpeg_decoder():
+    try:
+        import torch
+        from torchvision.io import decode_jpeg
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():  # pragma: no cover
+        return None
+    return decode_jpeg  # pragma: no cover
 
 
 def extract_input_for_getitem(element):
@@ -76,6 +210,9 @@ class GulpDirectory(object):
     ----------
     output_dir: (str)
         Path to the directory containing the files.
+    chunk_class: (subclass of GulpChunk)
+        The type of chunk new chunks are written as. Existing chunks are
+        read as the type given by the extension of their data file.
 
     Attributes
     ----------
@@ -90,23 +227,27 @@ class GulpDirectory(object):
 
     """
 
-    def __init__(self, output_dir, encode_jpg=True):
+    def __init__(self, output_dir, encode_jpg=True, chunk_class=None):
         self.output_dir = output_dir
         self.encode_jpg=encode_jpg
-        self.chunk_objs_lookup = OrderedDict(zip(self._chunk_ids(), self._chunks()))
+        self.chunk_class = chunk_class or GulpChunk
+        # glob once, directories on network filesystems are slow to list
+        file_paths = self._existing_file_paths()
+        self.chunk_objs_lookup = OrderedDict(zip(self._chunk_ids(file_paths),
+                                                 self._chunks(file_paths)))
         self.all_meta_dicts = [c.meta_dict for c in self.chunk_objs_lookup.values()]
         self.num_chunks = len(self.chunk_objs_lookup)
-        self.chunk_lookup = {}
-        for chunk_id, chunk in self.chunk_objs_lookup.items():
-            for id_ in chunk.meta_dict:
-                self.chunk_lookup[id_] = chunk_id
+        self.chunk_lookup = {id_: chunk_id
+                             for chunk_id, chunk
+                             in self.chunk_objs_lookup.items()
+                             for id_ in chunk.meta_dict}
         self.merged_meta_dict = {}
         for d in self.all_meta_dicts:
-            for k in d.keys():
-                assert k not in self.merged_meta_dict,\
-                    "Duplicate id detected {}".format(k)
-            else:
-                self.merged_meta_dict.update(d)
+            if not self.merged_meta_dict.keys().isdisjoint(d.keys()):
+                duplicate = next(k for k in d if k in self.merged_meta_dict)
+                raise AssertionError(
+                    "Duplicate id detected {}".format(duplicate))
+            self.merged_meta_dict.update(d)
 
     def __iter__(self):
         return iter(self.chunk_objs_lookup.values())
@@ -116,9 +257,12 @@ class GulpDirectory(object):
         to be opened and read from. """
         return self.__iter__()
 
-    def _chunks(self):
-        return (GulpChunk(*paths, encode_jpg=self.encode_jpg) 
-                for paths in self._existing_file_paths())
+    def _chunks(self, file_paths=None):
+        if file_paths is None:
+            file_paths = self._existing_file_paths()
+        return (_chunk_class_for(data_path)(data_path, meta_path,
+                                            encode_jpg=self.encode_jpg)
+                for data_path, meta_path in file_paths)
 
     def new_chunks(self, total_new_chunks):
         """ Return a generator over freshly setup GulpChunk objects which are ready
@@ -129,7 +273,8 @@ class GulpDirectory(object):
         total_new_chunks: (int)
             The total number of new chunks to initialize.
         """
-        return ((GulpChunk(*paths, encode_jpg=self.encode_jpg) for paths in
+        return ((self.chunk_class(*paths, encode_jpg=self.encode_jpg)
+                 for paths in
                  self._allocate_new_file_paths(total_new_chunks)))
 
     def __getitem__(self, element):
@@ -140,7 +285,9 @@ class GulpDirectory(object):
             return gulp_chunk[element]
 
     def _find_existing_data_paths(self):
-        return sorted(glob.glob(os.path.join(self.output_dir, 'data*.gulp')))
+        return sorted(path for path
+                      in glob.glob(os.path.join(self.output_dir, 'data*'))
+                      if os.path.splitext(path)[1] in _CHUNK_CLASSES)
 
     def _find_existing_meta_paths(self):
         return sorted(glob.glob(os.path.join(self.output_dir, 'meta*.gmeta')))
@@ -153,16 +300,17 @@ class GulpDirectory(object):
         data_paths = self._find_existing_data_paths()
         meta_paths = self._find_existing_meta_paths()
         assert len(data_paths) == len(meta_paths)
-        return zip(data_paths, meta_paths)
+        return list(zip(data_paths, meta_paths))
 
     def _find_ids_from_paths(self, paths):
-        return [int(re.findall(r'\d+', os.path.basename(p))[0]) for p in paths]
-
-    def _chunk_ids(self):
-        data_paths = self._find_existing_data_paths()
-        meta_paths = self._find_existing_meta_paths()
-        data_ids = self._find_ids_from_paths(data_paths)
-        meta_ids = self._find_ids_from_paths(meta_paths)
+        return [int(_ID_RE.search(os.path.basename(p)).group())
+                for p in paths]
+
+    def _chunk_ids(self, file_paths=None):
+        if file_paths is None:
+            file_paths = self._existing_file_paths()
+        data_ids = self._find_ids_from_paths(p for p, _ in file_paths)
+        meta_ids = self._find_ids_from_paths(p for _, p in file_paths)
         assert data_ids == meta_ids
         return data_ids
 
@@ -181,7 +329,8 @@ class GulpDirectory(object):
 
     def _initialize_filenames(self, chunk_id):
         data_file_path = os.path.join(
-            self.output_dir, 'data_{}.gulp'.format(chunk_id))
+            self.output_dir, 'data_{}{}'.format(
+                chunk_id, self.chunk_class.data_file_extension))
         meta_file_path = os.path.join(
             self.output_dir, 'meta_{}.gmeta'.format(chunk_id))
         return data_file_path, meta_file_path
@@ -201,8 +350,10 @@ class GulpChunk(object):
 
     """
 
+    data_file_extension = '.gulp'
+
     def __init__(self, data_file_path, meta_file_path,
-                 serializer=json_serializer,
+                 serializer=msgpack_serializer,
                  encode_jpg=True):
         self.serializer = serializer
         self.data_file_path = data_file_path
@@ -210,7 +361,22 @@ class GulpChunk(object):
         self.meta_dict = self._get_or_create_dict()
         self._img_info = {}
         self.fp = None
+        self.mm = None
+        self._loc = 0
+        self._last_entry = (None, None, None)
         self.encode_jpg = encode_jpg
+        self._tj = load_turbojpeg()
+
+    def __getstate__(self):
+        # neither the ctypes handles of TurboJPEG nor mmaps can be pickled
+        state = self.__dict__.copy()
+        state['_tj'] = None
+        state['mm'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._tj = load_turbojpeg()
 
     def __contains__(self, id_):
         return str(id_) in self.meta_dict
@@ -233,46 +399,143 @@ class GulpChunk(object):
 
     def _get_or_create_img_info(self, id_):
         if id_ not in self._img_info:
-            self._img_info[id_] = [ImgInfo(*info) for info in self.meta_dict[id_]['frame_info']]
+            frame_info = self.meta_dict[id_]['frame_info']
+            self._img_info[id_] = ImgInfo(
+                *(np.asarray(frame_info[field], dtype=np.int64)
+                  for field in ImgInfo._fields))
         return self._img_info[id_]
 
     def _get_or_create_dict(self):
         if os.path.exists(self.meta_file_path):
-            return self.serializer.load(self.meta_file_path)
+            meta_dict = self.serializer.load(self.meta_file_path)
+            for meta in meta_dict.values():
+                meta['frame_info'] = self._upgrade_frame_info(
+                    meta['frame_info'])
+            return meta_dict
         else:
             return OrderedDict()
 
+    @staticmethod
+    def _upgrade_frame_info(frame_info):
+        # older gulps store one [loc, pad, length] triplet per frame
+        if isinstance(frame_info, list):
+            columns = list(zip(*frame_info)) or [()] * len(ImgInfo._fields)
+            return OrderedDict((field, list(column)) for field, column
+                               in zip(ImgInfo._fields, columns))
+        return frame_info
+
     @staticmethod
     def _default_factory():
-        return OrderedDict([('frame_info', []), ('meta_data', [])])
+        return OrderedDict([('frame_info', OrderedDict((field, [])
+                                                       for field
+                                                       in ImgInfo._fields)),
+                            ('meta_data', [])])
 
     @staticmethod
     def _pad_image(number):
-        return (4 - (number % 4)) % 4
+        return -number & 3
+
+    def _get_or_create_entry(self, id_):
+        # consecutive frames belong to the same item, skip the lookup then
+        last_dict, last_id, entry = self._last_entry
+        if id_ != last_id or last_dict is not self.meta_dict:
+            entry = self.meta_dict.get(id_)
+            if entry is None:  # implements an OrderedDefaultDict
+                entry = self.meta_dict[id_] = self._default_factory()
+            self._last_entry = (self.meta_dict, id_, entry)
+        return entry
 
     def _append_meta(self, id_, meta_data):
-        id_ = str(id_)
-        if id_ not in self.meta_dict:  # implements an OrderedDefaultDict
-            self.meta_dict[id_] = self._default_factory()
-        self.meta_dict[id_]['meta_data'].append(meta_data)
+        self._get_or_create_entry(str(id_))['meta_data'].append(meta_data)
+
+    def _encode_jpg(self, image):
+        channels = self._turbojpeg_channels(image)
+        if channels == 1:
+            return self._tj.encode(
+                np.ascontiguousarray(image.reshape(image.shape[:2] + (1,))),
+                quality=JPEG_QUALITY,
+                pixel_format=TJPF_GRAY,
+                jpeg_subsample=TJSAMP_GRAY)
+        if channels == 3:
+            return self._tj.encode(np.ascontiguousarray(image),
+                                   quality=JPEG_QUALITY,
+                                   pixel_format=TJPF_BGR,
+                                   jpeg_subsample=TJSAMP_420)
+        return cv2.imencode('.jpg', image)[1].tostring()
+
+    def _turbojpeg_channels(self, image):
+        # the number of channels if TurboJPEG can encode the image, else None
+        if (self._tj is None or not isinstance(image, np.ndarray) or
+                image.dtype != np.uint8):
+            return None
+        if image.ndim == 2:
+            return 1
+        if image.ndim == 3 and image.shape[2] in (1, 3):
+            return image.shape[2]
+        return None
+
+    def _decode_jpg(self, img_str):
+        if self._tj is not None:
+            if self._tj.decode_header(img_str)[2] == TJSAMP_GRAY:
+                img = self._tj.decode(img_str, pixel_format=TJPF_GRAY)
+                return img[..., 0]
+            return self._tj.decode(img_str, pixel_format=TJPF_RGB)
+        nparr = np.frombuffer(img_str, np.uint8)
+        img = cv2.imdecode(nparr, cv2.IMREAD_ANYCOLOR)
+        if img.ndim > 2:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        return img
+
+    def _read_img_str(self, loc, size):
+        if self.mm is not None:
+            return self.mm[loc:loc + size]
+        self.fp.seek(loc)
+        return self.fp.read(size)
+
+    def _read_img_strs(self, id_, slice_=None):
+        img_info, meta_data = self._get_frame_infos(id_)
+        slice_element = slice_ or slice(0, len(img_info.loc))
+        locs = img_info.loc[slice_element].tolist()
+        sizes = (img_info.length[slice_element] -
+                 img_info.pad[slice_element]).tolist()
+        return ([self._read_img_str(loc, size)
+                 for loc, size in zip(locs, sizes)],
+                meta_data)
+
+    def encode_frame(self, image):
+        """ Encode a single frame into the bytes stored in the chunk.
+
+        If the chunk encodes JPEG, frames given as bytes are taken to be
+        already encoded and are returned as they are. Safe to call from
+        several threads.
+
+        """
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            if not self.encode_jpg:
+                raise ValueError("Encoded frames can not be written to a "
+                                 "chunk with encode_jpg=False")
+            # already encoded, e.g. JPEG files read from disk
+            return bytes(image)
+        elif self.encode_jpg:
+            return self._encode_jpg(image)
+        else:
+            return image.tostring()
 
     def _write_frame(self, id_, image):
-        loc = self.fp.tell()
-        if self.encode_jpg:
-            image = cv2.imencode('.jpg', image)[1]
-        img_str = image.tostring()
+        img_str = self.encode_frame(image)
         assert len(img_str) > 0
         pad = self._pad_image(len(img_str))
-        record = img_str.ljust(len(img_str) + pad, b'\0')
-        assert len(record) > 0
-        img_info = ImgInfo(loc=loc,
-                           length=len(record),
-                           pad=pad)
-        id_ = str(id_)
-        if id_ not in self.meta_dict:  # implements an OrderedDefaultDict
-            self.meta_dict[id_] = self._default_factory()
-        self.meta_dict[id_]['frame_info'].append(img_info)
-        self.fp.write(record)
+        length = len(img_str) + pad
+        frame_info = self._get_or_create_entry(str(id_))['frame_info']
+        frame_info['loc'].append(self._loc)
+        frame_info['pad'].append(pad)
+        frame_info['length'].append(length)
+        if _HAS_WRITEV:
+            writev_all(self.fp.fileno(), (img_str, _PAD[pad]))
+        else:
+            self.fp.write(img_str)
+            self.fp.write(_PAD[pad])
+        self._loc += length
 
     def _write_frames(self, id_, frames):
         for frame in frames:
@@ -294,16 +557,35 @@ class GulpChunk(object):
         Works as a context manager but returns None.
 
         """
-        if flag in ['wb', 'rb', 'ab']:
+        if flag in ['wb', 'ab']:
+            # records written with os.writev need no buffer, plain writes do
+            if _HAS_WRITEV:
+                self.fp = open(self.data_file_path, flag, buffering=0)
+            else:
+                self.fp = open(self.data_file_path, flag)
+            self._loc = self.fp.tell()
+        elif flag == 'rb':
             self.fp = open(self.data_file_path, flag)
+            # frames are sliced from the map, saving a seek and a read per
+            # frame; empty files can not be mapped
+            if os.fstat(self.fp.fileno()).st_size > 0:
+                self.mm = mmap.mmap(self.fp.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
         else:
             m = "This file does not support the mode: '{}'".format(flag)
             raise NotImplementedError(m)
         yield
         if flag in ['wb', 'ab']:
             self.flush()
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
         self.fp.close()
 
+    def _advise_sequential(self):
+        if self.mm is not None and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self.mm.madvise(mmap.MADV_SEQUENTIAL)
+
     def flush(self):
         """Flush all buffers and write the meta file."""
         self.fp.flush()
@@ -318,9 +600,10 @@ class GulpChunk(object):
             The ID of the item
         meta_data: (dict)
             The meta-data associated with the item.
-        frames: (list of numpy arrays)
+        frames: (list of numpy arrays or bytes)
             The frames of the item as a list of numpy dictionaries consisting
-            of image pixel values.
+            of image pixel values. Frames given as bytes are taken to be
+            already encoded and are written as they are.
 
         """
         self._append_meta(id_, meta_data)
@@ -342,24 +625,73 @@ class GulpChunk(object):
             image pixel values. And the metadata.
 
         """
-        frame_infos, meta_data = self._get_frame_infos(id_)
-        slice_element = slice_ or slice(0, len(frame_infos))
+        img_strs, meta_data = self._read_img_strs(id_, slice_)
+        return self._extract_frames(img_strs), meta_data
+
+    def _extract_frames(self, img_strs):
 
-        def extract_frame(frame_info):
-            self.fp.seek(frame_info.loc)
-            record = self.fp.read(frame_info.length)
-            img_str = record[:len(record)-frame_info.pad]
+        def extract_frame(img_str):
             if self.encode_jpg:
-                nparr = np.frombuffer(img_str, np.uint8)
-                img = cv2.imdecode(nparr, cv2.IMREAD_ANYCOLOR)
-                if img.ndim > 2:
-                    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                return img
+                return self._decode_jpg(img_str)
             nparr = np.frombuffer(img_str, np.int16)
             return nparr
-        frames = [extract_frame(frame_info)
-                  for frame_info in frame_infos[slice_element]]
-        return frames, meta_data
+        return [extract_frame(img_str) for img_str in img_strs]
+
+    def read_frames_batch(self, id_, slice_=None, stream=None):
+        """ Read frames for a single item and decode them as one batch.
+
+        If torchvision and a CUDA device are available, all JPEG frames are
+        decoded in a single batched nvJPEG call on the GPU. Otherwise this
+        falls back to `read_frames`.
+
+        Parameters
+        ----------
+        id_: (str)
+            The ID of the item
+        slice_: (slice)
+            A slice with which to select frames.
+        stream: (torch.cuda.Stream)
+            The CUDA stream to decode on. Default is the current stream.
+
+        Returns
+        -------
+        frames, meta(dict)
+            The frames of the item stacked into a single array of shape
+            (N, H, W, 3) -- a CUDA tensor when decoded on the GPU, a numpy
+            array otherwise. And the metadata.
+
+        """
+        decode_jpeg = load_cuda_jpeg_decoder() if self.encode_jpg else None
+        img_strs, meta_data = self._read_img_strs(id_, slice_)
+        if decode_jpeg is None:
+            return self._decode_jpgs_stacked(img_strs), meta_data
+        return self._decode_jpgs_cuda(decode_jpeg, img_strs,
+                                      stream), meta_data
+
+    def _decode_jpgs_stacked(self, img_strs):
+        if (self._tj is None or not _TJ_DECODE_DST or not self.encode_jpg or
+                not img_strs):
+            return np.stack(self._extract_frames(img_strs))
+        # decode straight into the stacked array instead of allocating every
+        # frame and copying it over
+        width, height, subsample, _ = self._tj.decode_header(img_strs[0])
+        gray = subsample == TJSAMP_GRAY
+        frames = np.empty((len(img_strs), height, width, 1 if gray else 3),
+                          dtype=np.uint8)
+        pixel_format = TJPF_GRAY if gray else TJPF_RGB
+        for frame, img_str in zip(frames, img_strs):
+            self._tj.decode(img_str, pixel_format=pixel_format, dst=frame)
+        return frames[..., 0] if gray else frames
+
+    @staticmethod
+    def _decode_jpgs_cuda(decode_jpeg, img_strs, stream):  # pragma: no cover
+        import torch
+        from torchvision.io import ImageReadMode
+        data = [torch.frombuffer(bytearray(img_str), dtype=torch.uint8)
+                for img_str in img_strs]
+        with torch.cuda.stream(stream or torch.cuda.current_stream()):
+            frames = decode_jpeg(data, mode=ImageReadMode.RGB, device='cuda')
+            return torch.stack(frames).permute(0, 2, 3, 1)
 
     def iter_all(self, accepted_ids=None, shuffle=False):
         """ Iterate over all frames in the gulp.
@@ -376,6 +708,12 @@ class GulpChunk(object):
         iterator
             An iterator that yield a series of frames,meta tuples. See
             `read_frames` for details.
+
+        Notes
+        -----
+        The bytes of the next item are read in a background thread while
+        the frames of the current one are decoded.
+
         """
 
         ids = self.meta_dict.keys()
@@ -388,10 +726,161 @@ class GulpChunk(object):
             ids = list(ids)
             np.random.shuffle(ids)
 
-        with self.open('rb'):
+        with self.open('rb'), ThreadPoolExecutor(max_workers=1) as executor:
+            if not shuffle:
+                self._advise_sequential()
+            # at most one item is read ahead, this bounds the memory used
+            pending = None
             for id_ in ids:
-                frames, meta = self.read_frames(id_)
-                yield frames, meta
+                future = executor.submit(self._read_img_strs, id_)
+                if pending is not None:
+                    yield self._extract_item(pending)
+                pending = future
+            if pending is not None:
+                yield self._extract_item(pending)
+
+    def _extract_item(self, future):
+        img_strs, meta = future.result()
+        return self._extract_frames(img_strs), meta
+
+
+class ArrowGulpChunk(GulpChunk):
+    """ Represents a gulp chunk whose data file is an Arrow IPC file.
+
+    The data file holds one row per frame with the columns `id`,
+    `jpeg_bytes` and `meta`, the meta-data of an item is stored msgpack
+    encoded, as in the meta file, in the row of its first frame.  The meta file is the same as
+    for a `GulpChunk`, except that `loc` is the index of the row of a
+    frame and `pad` is always zero.  Frames are read as zero-copy slices
+    of the memory mapped data file, named `data_<id>.arrow`.  Requires
+    `pyarrow`.
+
+    Notes
+    -----
+    Arrow files can not be appended to, so only the modes 'rb' and 'wb'
+    are supported by `open`.  Rows are written in record batches of
+    `rows_per_batch` frames.  The data file is mapped on the first
+    `open('rb')` and stays mapped while the chunk lives, just like the
+    meta file is only loaded once.
+
+    """
+
+    data_file_extension = '.arrow'
+    rows_per_batch = 1024
+
+    def __init__(self, data_file_path, meta_file_path,
+                 serializer=msgpack_serializer,
+                 encode_jpg=True):
+        if pa is None:
+            raise ImportError("ArrowGulpChunk requires pyarrow")
+        super().__init__(data_file_path, meta_file_path,
+                         serializer=serializer, encode_jpg=encode_jpg)
+        self._writer = None
+        self._rows = None
+        self._frames = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_writer'] = None
+        state['_rows'] = None
+        state['_frames'] = None
+        return state
+
+    @staticmethod
+    def schema():
+        return pa.schema([('id', pa.string()),
+                          ('jpeg_bytes', pa.large_binary()),
+                          ('meta', pa.binary())])
+
+    def _read_img_str(self, loc, size):
+        return self._frames[loc].as_buffer()
+
+    def _write_frame(self, id_, image):
+        self._write_frames(id_, [image])
+
+    def _write_frames(self, id_, frames, meta_data=None):
+        img_strs = [self.encode_frame(frame) for frame in frames]
+        assert all(len(img_str) > 0 for img_str in img_strs)
+        num_frames = len(img_strs)
+        frame_info = self._get_or_create_entry(str(id_))['frame_info']
+        frame_info['loc'].extend(range(self._loc, self._loc + num_frames))
+        frame_info['pad'].extend([0] * num_frames)
+        frame_info['length'].extend(len(img_str) for img_str in img_strs)
+        meta = [None] * num_frames
+        if meta_data is not None and num_frames > 0:
+            meta[0] = msgpack.packb(meta_data, use_bin_type=True,
+                                    default=_pack_numpy)
+        ids, jpeg_bytes, metas = self._rows
+        ids.extend([str(id_)] * num_frames)
+        jpeg_bytes.extend(img_strs)
+        metas.extend(meta)
+        self._loc += num_frames
+        if len(ids) >= self.rows_per_batch:
+            self._write_batch()
+
+    def _write_batch(self):
+        ids, jpeg_bytes, metas = self._rows
+        if ids:
+            self._writer.write_batch(pa.record_batch(
+                [pa.array(ids, pa.string()),
+                 pa.array(jpeg_bytes, pa.large_binary()),
+                 pa.array(metas, pa.binary())],
+                schema=self.schema()))
+        self._rows = ([], [], [])
+
+    def append(self, id_, meta_data, frames):
+        """ Append an item to the gulp, see `GulpChunk.append`. """
+        self._append_meta(id_, meta_data)
+        self._write_frames(id_, frames, meta_data)
+
+    @contextmanager
+    def open(self, flag='rb'):
+        """Open the gulp chunk for reading or writing.
+
+        Parameters
+        ----------
+        flag: (str)
+            'rb': Read binary
+            'wb': Write binary
+
+        Notes
+        -----
+        Works as a context manager but returns None.
+
+        """
+        if flag == 'wb':
+            self._frames = None
+            self.fp = open(self.data_file_path, flag)
+            self._writer = pa.ipc.new_file(self.fp, self.schema())
+            self._rows = ([], [], [])
+            self._loc = 0
+        elif flag == 'rb':
+            if self._frames is None:
+                # the column keeps the mapping alive once the file is closed
+                with pa.memory_map(self.data_file_path) as source:
+                    self._frames = (pa.ipc.open_file(source).read_all()
+                                    .column('jpeg_bytes'))
+        else:
+            m = "This file does not support the mode: '{}'".format(flag)
+            raise NotImplementedError(m)
+        yield
+        if flag == 'wb':
+            self._write_batch()
+            # writes the footer holding the offsets of all record batches
+            self._writer.close()
+            self._writer = None
+            self._rows = None
+            self.flush()
+            self.fp.close()
+
+
+# the chunk class by extension of the data file
+_CHUNK_CLASSES = {GulpChunk.data_file_extension: GulpChunk,
+                  ArrowGulpChunk.data_file_extension: ArrowGulpChunk}
+
+
+def _chunk_class_for(data_file_path):
+    return _CHUNK_CLASSES[os.path.splitext(data_file_path)[1]]
 
 
 class ChunkWriter(object):
@@ -401,11 +890,15 @@ class ChunkWriter(object):
     ----------
     adapter: (subclass of AbstractDatasetAdapter)
        The adapter to get items from.
+    frame_workers: (int)
+       The number of threads encoding the frames of an item in parallel.
 
     """
 
-    def __init__(self, adapter):
+    def __init__(self, adapter, frame_workers=4):
+        assert int(frame_workers) > 0
         self.adapter = adapter
+        self.frame_workers = int(frame_workers)
 
     def write_chunk(self, output_chunk, input_slice):
         """Write from an input slice in the adapter to an output chunk.
@@ -418,11 +911,17 @@ class ChunkWriter(object):
            The slice to use from the adapter.
 
         """
-        with output_chunk.open('wb'):
+        with output_chunk.open('wb'), \
+                ThreadPoolExecutor(max_workers=self.frame_workers) as executor:
             for video in self.adapter.iter_data(input_slice):
                 id_ = video['id']
                 meta_data = video['meta']
                 frames = video['frames']
+                if (len(frames) > 1 and self.frame_workers > 1 and
+                        output_chunk.encode_jpg):
+                    # encoding releases the GIL, only the writes are serial
+                    frames = list(executor.map(output_chunk.encode_frame,
+                                               frames))
                 if len(frames) > 0:
                     output_chunk.append(id_, meta_data, frames)
                 else:
@@ -430,6 +929,21 @@ class ChunkWriter(object):
                           .format(id_))
 
 
+# the ChunkWriter of an ingest worker process, see `_init_worker`
+_worker_chunk_writer = None
+
+
+def _init_worker(chunk_writer):
+    # runs once per worker, so the adapter is unpickled once per worker and
+    # not once per chunk
+    global _worker_chunk_writer
+    _worker_chunk_writer = chunk_writer
+
+
+def _write_chunk(chunk_and_slice):
+    return _worker_chunk_writer.write_chunk(*chunk_and_slice)
+
+
 def calculate_chunk_slices(items_per_chunk, num_items):
     """Calculate slices for indexing an adapter.
 
@@ -463,34 +977,59 @@ class GulpIngestor(object):
     videos_per_chunk: (int)
         The total number of items per chunk.
     num_workers: (int)
-        The level of parallelism.
+        The level of parallelism. With a single worker the chunks are
+        written in the current process.
     encode_jpg: (bool)
         Encode the images in the chunk as jpg
+    start_method: (str)
+        The multiprocessing start method of the worker processes, e.g.
+        'fork' or 'spawn'. Default is the platform default.
+    frame_workers: (int)
+        The number of threads per worker encoding the frames of an item.
+    chunk_class: (subclass of GulpChunk)
+        The type of chunk to write, e.g. `ArrowGulpChunk`. Default is
+        `GulpChunk`.
 
     """
     def __init__(self, adapter, output_folder,
-                 videos_per_chunk, num_workers, encode_jpg=True):
+                 videos_per_chunk, num_workers, encode_jpg=True,
+                 start_method=None, frame_workers=4, chunk_class=None):
         assert int(num_workers) > 0
         self.adapter = adapter
         self.output_folder = output_folder
         self.videos_per_chunk = int(videos_per_chunk)
         self.num_workers = int(num_workers)
         self.encode_jpg = encode_jpg
+        self.start_method = start_method
+        self.frame_workers = int(frame_workers)
+        self.chunk_class = chunk_class
 
     def __call__(self):
         os.makedirs(self.output_folder, exist_ok=True)
         chunk_slices = calculate_chunk_slices(self.videos_per_chunk,
                                               len(self.adapter))
-        gulp_directory = GulpDirectory(self.output_folder, self.encode_jpg)
+        gulp_directory = GulpDirectory(self.output_folder, self.encode_jpg,
+                                       self.chunk_class)
         new_chunks = gulp_directory.new_chunks(len(chunk_slices))
-        chunk_writer = ChunkWriter(self.adapter)
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
-            result = executor.map(chunk_writer.write_chunk,
-                                  new_chunks,
-                                  chunk_slices)
-            for r in tqdm(result,
-                          desc='Chunks finished',
-                          unit='chunk',
-                          dynamic_ncols=True,
-                          total=len(chunk_slices)):
-                pass
+        chunk_writer = ChunkWriter(self.adapter, self.frame_workers)
+        chunks_and_slices = zip(new_chunks, chunk_slices)
+        if self.num_workers == 1:
+            results = (chunk_writer.write_chunk(*chunk_and_slice)
+                       for chunk_and_slice in chunks_and_slices)
+            self._wait_for(results, len(chunk_slices))
+        else:
+            context = get_context(self.start_method)
+            with context.Pool(self.num_workers,
+                              initializer=_init_worker,
+                              initargs=(chunk_writer,)) as pool:
+                results = pool.imap_unordered(_write_chunk, chunks_and_slices)
+                self._wait_for(results, len(chunk_slices))
+
+    @staticmethod
+    def _wait_for(results, total):
+        for r in tqdm(results,
+                      desc='Chunks finished',
+                      unit='chunk',
+                      dynamic_ncols=True,
+                      total=total):
+            pass
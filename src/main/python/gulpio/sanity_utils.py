@@ -1,6 +1,8 @@
 import os
 import collections
 
+from gulpio.fileio import ArrowGulpChunk, pa
+
 
 ###############################################################################
 #                           Checks                                            #
@@ -22,10 +24,15 @@ def check_data_file_size(gulp_directory):
     result = []
     for chunk in gulp_directory.chunks():
         last_frame_info = (chunk.meta_dict[next(reversed(chunk.meta_dict))]
-                                          ['frame_info']
-                                          [-1])
-        data_file_size_from_meta = last_frame_info[0] + last_frame_info[2]
-        data_file_size = os.stat(chunk.data_file_path).st_size
+                                          ['frame_info'])
+        if isinstance(chunk, ArrowGulpChunk):
+            # 'loc' is the row of a frame, compare the number of rows instead
+            data_file_size_from_meta = last_frame_info['loc'][-1] + 1
+            data_file_size = count_arrow_rows(chunk.data_file_path)
+        else:
+            data_file_size_from_meta = (last_frame_info['loc'][-1] +
+                                        last_frame_info['length'][-1])
+            data_file_size = os.stat(chunk.data_file_path).st_size
         if not data_file_size == data_file_size_from_meta:
             result.append(chunk.data_file_path)
     return result
@@ -47,6 +54,12 @@ def extract_all_ids(gulp_directory):
     return all_ids
 
 
+def count_arrow_rows(data_file_path):
+    reader = pa.ipc.open_file(pa.memory_map(data_file_path))
+    return sum(reader.get_batch(i).num_rows
+               for i in range(reader.num_record_batches))
+
+
 def get_duplicate_entries(list_):
     c = collections.Counter(list_)
     return [i for i in c if c[i] > 1]
@@ -69,9 +69,18 @@ class DuplicateIdException(Exception):
     pass
 
 
-def resize_images(imgs, img_size=-1):
+def resize_images(imgs, img_size=-1, keep_jpg=False):
+    """
+    - Read images from paths and resize them by their short edge
+    - If `keep_jpg` is set and no resizing is requested, JPEG files are
+      returned as their raw bytes so they can be gulped without re-encoding
+    """
     for img in imgs:
         img_path = img
+        if keep_jpg and img_size < 1 and is_jpg_path(img_path):
+            with open(img_path, 'rb') as fp:
+                yield fp.read()
+            continue
         img = cv2.imread(img_path, cv2.IMREAD_ANYCOLOR)
         if img is None:
             raise ImageNotFound("Image is  None from path:{}".format(img_path))
@@ -80,6 +89,10 @@ def resize_images(imgs, img_size=-1):
         yield img
 
 
+def is_jpg_path(path):
+    return os.path.splitext(path)[1].lower() in ('.jpg', '.jpeg')
+
+
 def resize_by_short_edge(img, size):
     if isinstance(img, str):
         img_path = img
@@ -1,11 +1,12 @@
 import os
+import glob
 import tempfile
 import shutil
 import json
 import pickle
+import msgpack
 
 from collections import OrderedDict
-from io import BytesIO
 
 import numpy as np
 import numpy.testing as npt
@@ -14,14 +15,21 @@ import unittest
 import unittest.mock as mock
 
 from gulpio.fileio import (GulpChunk,
+                           ArrowGulpChunk,
                            ChunkWriter,
                            GulpIngestor,
                            GulpDirectory,
                            calculate_chunk_slices,
                            json_serializer,
+                           msgpack_serializer,
                            pickle_serializer,
                            extract_input_for_getitem,
                            ImgInfo,
+                           TurboJPEG,
+                           pa,
+                           load_cuda_jpeg_decoder,
+                           _init_worker,
+                           _write_chunk,
                            )
 from gulpio.adapters import AbstractDatasetAdapter
 
@@ -53,6 +61,58 @@ class TestJSONSerializer(FSBase):
         self.assertEqual(content, received_content)
 
 
+class TestMsgpackSerializer(FSBase):
+
+    def test_dump(self):
+        filename = os.path.join(self.temp_dir, 'ANY_MSGPACK.gmeta')
+        content = {'ANY_KEY': 'ANY_CONTENT'}
+        msgpack_serializer.dump(content, filename)
+        with open(filename, 'rb') as fp:
+            written_content = msgpack.unpackb(fp.read(), raw=False)
+        self.assertEqual(content, written_content)
+
+    def test_load(self):
+        filename = os.path.join(self.temp_dir, 'ANY_MSGPACK.gmeta')
+        content = OrderedDict([('B_KEY', [1, 2]), ('A_KEY', 'ANY_CONTENT')])
+        msgpack_serializer.dump(content, filename)
+        received_content = msgpack_serializer.load(filename)
+        self.assertEqual(content, received_content)
+        self.assertIsInstance(received_content, OrderedDict)
+
+    def test_load_json(self):
+        filename = os.path.join(self.temp_dir, 'ANY_JSON.gmeta')
+        content = {'ANY_KEY': 'ANY_CONTENT'}
+        json_serializer.dump(content, filename)
+        received_content = msgpack_serializer.load(filename)
+        self.assertEqual(content, received_content)
+
+    def test_numpy(self):
+        filename = os.path.join(self.temp_dir, 'ANY_MSGPACK.gmeta')
+        array = np.arange(6, dtype='int64').reshape((2, 3))
+        msgpack_serializer.dump({'array': array, 'scalar': np.int64(1)},
+                                filename)
+        received_content = msgpack_serializer.load(filename)
+        npt.assert_array_equal(array, received_content['array'])
+        self.assertEqual(array.dtype, received_content['array'].dtype)
+        self.assertEqual(1, received_content['scalar'])
+
+    def test_non_str_keys(self):
+        filename = os.path.join(self.temp_dir, 'ANY_MSGPACK.gmeta')
+        content = {'0': {'meta_data': [{'labels': {0: 'cat', 1: 'dog'}}]}}
+        msgpack_serializer.dump(content, filename)
+        self.assertEqual(content, msgpack_serializer.load(filename))
+
+    def test_chunk_with_non_str_keys_round_trip(self):
+        data_file_path = os.path.join(self.temp_dir, 'ANY_DATA_FILE_PATH')
+        meta_file_path = os.path.join(self.temp_dir, 'ANY_META_FILE_PATH')
+        gulp_chunk = GulpChunk(data_file_path, meta_file_path)
+        with gulp_chunk.open('wb'):
+            gulp_chunk.append(0, {'labels': {0: 'cat'}}, [b'\x01'])
+        gulp_chunk = GulpChunk(data_file_path, meta_file_path)
+        self.assertEqual([{'labels': {0: 'cat'}}],
+                         gulp_chunk.meta_dict['0']['meta_data'])
+
+
 class TestPickleSerializer(FSBase):
 
     def test_dump(self):
@@ -137,6 +197,22 @@ class GulpChunkElement(FSBase):
                                     self.meta_file_path,
                                     mock_json_serializer)
 
+    def read_data_file(self):
+        with open(self.data_file_path, 'rb') as fp:
+            return fp.read()
+
+
+class TestLoadCudaJpegDecoder(unittest.TestCase):
+
+    @mock.patch('gulpio.fileio._cuda_jpeg_decoder_resolved', False)
+    @mock.patch('gulpio.fileio._cuda_jpeg_decoder', None)
+    @mock.patch('gulpio.fileio._find_cuda_jpeg_decoder')
+    def test_resolved_once(self, find_mock):
+        find_mock.return_value = 'ANY_DECODER'
+        self.assertEqual('ANY_DECODER', load_cuda_jpeg_decoder())
+        self.assertEqual('ANY_DECODER', load_cuda_jpeg_decoder())
+        find_mock.assert_called_once_with()
+
 
 class TestGulpChunk(GulpChunkElement):
 
@@ -160,31 +236,74 @@ class TestGulpChunk(GulpChunkElement):
         self.mock_json_serializer.load.called_once_with(self.meta_file_path)
 
     def test_default_factory(self):
-        expected = OrderedDict([('frame_info', []), ('meta_data', [])])
+        expected = OrderedDict([('frame_info', OrderedDict([('loc', []),
+                                                            ('pad', []),
+                                                            ('length', [])])),
+                                ('meta_data', [])])
         self.assertEqual(expected, self.gulp_chunk._default_factory())
 
+    def test_upgrade_frame_info(self):
+        expected = OrderedDict([('loc', [0, 4]),
+                                ('pad', [1, 2]),
+                                ('length', [4, 8])])
+        self.assertEqual(expected, GulpChunk._upgrade_frame_info(
+            [[0, 1, 4], [4, 2, 8]]))
+        self.assertEqual(expected, GulpChunk._upgrade_frame_info(expected))
+
+    def test_upgrade_frame_info_empty(self):
+        expected = OrderedDict([('loc', []), ('pad', []), ('length', [])])
+        self.assertEqual(expected, GulpChunk._upgrade_frame_info([]))
+
+    def test_get_or_create_dict_upgrades_frame_info(self):
+        self.gulp_chunk.serializer = json_serializer
+        with open(self.meta_file_path, 'w') as fp:
+            json.dump({'0': {'frame_info': [[0, 1, 4]], 'meta_data': []}}, fp)
+        expected = {'0': {'frame_info': {'loc': [0], 'pad': [1],
+                                         'length': [4]},
+                          'meta_data': []}}
+        self.assertEqual(expected, self.gulp_chunk._get_or_create_dict())
+
     def test_open_with_wb(self):
         self.gulp_chunk.flush = mock.Mock()
         with mock.patch('builtins.open', new_callable=mock.mock_open()) as m:
             with self.gulp_chunk.open('wb'):
                 m.assert_called_once_with(
-                    self.gulp_chunk.data_file_path, 'wb')
+                    self.gulp_chunk.data_file_path, 'wb', buffering=0)
             self.gulp_chunk.flush.assert_called_once_with()
 
     def test_open_with_rb(self):
         self.gulp_chunk.flush = mock.Mock()
-        with mock.patch('builtins.open', new_callable=mock.mock_open()) as m:
+        with mock.patch('builtins.open', new_callable=mock.mock_open()) as m, \
+                mock.patch('os.fstat') as fstat_mock:
+            fstat_mock.return_value.st_size = 0
             with self.gulp_chunk.open('rb'):
                 m.assert_called_once_with(
                     self.gulp_chunk.data_file_path, 'rb')
             self.assertFalse(self.gulp_chunk.flush.called)
 
+    def test_open_with_rb_maps_data_file(self):
+        self.gulp_chunk.meta_dict = OrderedDict()
+        with self.gulp_chunk.open('wb'):
+            self.gulp_chunk._write_frame(0, b'\x01\x02')
+        with self.gulp_chunk.open('rb'):
+            self.assertIsNotNone(self.gulp_chunk.mm)
+            self.assertEqual(b'\x01\x02',
+                             self.gulp_chunk._read_img_str(0, 2))
+        self.assertIsNone(self.gulp_chunk.mm)
+
+    def test_open_with_rb_empty_data_file(self):
+        self.gulp_chunk.meta_dict = OrderedDict()
+        with self.gulp_chunk.open('wb'):
+            pass
+        with self.gulp_chunk.open('rb'):
+            self.assertIsNone(self.gulp_chunk.mm)
+
     def test_open_with_ab(self):
         self.gulp_chunk.flush = mock.Mock()
         with mock.patch('builtins.open', new_callable=mock.mock_open()) as m:
             with self.gulp_chunk.open('ab'):
                 m.assert_called_once_with(
-                    self.gulp_chunk.data_file_path, 'ab')
+                    self.gulp_chunk.data_file_path, 'ab', buffering=0)
             self.gulp_chunk.flush.assert_called_once_with()
 
     def test_open_unknown_flag(self):
@@ -213,9 +332,18 @@ class TestGulpChunk(GulpChunkElement):
         self.gulp_chunk.meta_dict = {}
         self.gulp_chunk._append_meta(0, {'meta': 'ANY_META'})
         expected = {'0': {'meta_data': [{'meta': 'ANY_META'}],
-                          'frame_info': []}}
+                          'frame_info': {'loc': [], 'pad': [],
+                                         'length': []}}}
         self.assertEqual(expected, self.gulp_chunk.meta_dict)
 
+    def test_append_meta_after_meta_dict_replaced(self):
+        self.gulp_chunk.meta_dict = {}
+        self.gulp_chunk._append_meta(0, {'meta': 'ANY_META'})
+        self.gulp_chunk.meta_dict = {}
+        self.gulp_chunk._append_meta(0, {'meta': 'OTHER_META'})
+        self.assertEqual([{'meta': 'OTHER_META'}],
+                         self.gulp_chunk.meta_dict['0']['meta_data'])
+
     def test_pad_image(self):
         self.assertEqual(0, GulpChunk._pad_image(0))
         self.assertEqual(1, GulpChunk._pad_image(3))
@@ -224,37 +352,145 @@ class TestGulpChunk(GulpChunkElement):
         self.assertEqual(0, GulpChunk._pad_image(4))
 
     def test_write_frame(self):
-        bio = BytesIO()
         self.gulp_chunk.meta_dict = {'0': {'meta_data': [{'test': 'ANY'}],
-                                           'frame_info': [[1, 2, 3]]}}
-        self.gulp_chunk.fp = bio
+                                           'frame_info': {'loc': [1],
+                                                          'pad': [2],
+                                                          'length': [3]}}}
         with mock.patch('cv2.imencode') as imencode_mock:
             imencode_mock.return_value = '', np.ones((1,), dtype='uint8')
-            self.gulp_chunk._write_frame(0, None)
-            self.assertEqual(b'\x01\x00\x00\x00', bio.getvalue())
+            with self.gulp_chunk.open('wb'):
+                self.gulp_chunk._write_frame(0, None)
+            self.assertEqual(b'\x01\x00\x00\x00', self.read_data_file())
             expected = {'0': {'meta_data': [{'test': 'ANY'}],
-                              'frame_info': [[1, 2, 3], ImgInfo(0, 3, 4)]}}
+                              'frame_info': {'loc': [1, 0],
+                                             'pad': [2, 3],
+                                             'length': [3, 4]}}}
             self.assertEqual(expected, self.gulp_chunk.meta_dict)
 
     def test_write_frame_new_entry(self):
-        bio = BytesIO()
         self.gulp_chunk.meta_dict = {}
-        self.gulp_chunk.fp = bio
         with mock.patch('cv2.imencode') as imencode_mock:
             imencode_mock.return_value = '', np.ones((1,), dtype='uint8')
-            self.gulp_chunk._write_frame(0, None)
-            self.assertEqual(b'\x01\x00\x00\x00', bio.getvalue())
+            with self.gulp_chunk.open('wb'):
+                self.gulp_chunk._write_frame(0, None)
+            self.assertEqual(b'\x01\x00\x00\x00', self.read_data_file())
             expected = {'0': {'meta_data': [],
-                              'frame_info': [ImgInfo(0, 3, 4)]}}
+                              'frame_info': {'loc': [0], 'pad': [3],
+                                             'length': [4]}}}
             self.assertEqual(expected, self.gulp_chunk.meta_dict)
 
+    def test_write_frame_encoded_bytes(self):
+        self.gulp_chunk.meta_dict = {}
+        with mock.patch('cv2.imencode') as imencode_mock:
+            with self.gulp_chunk.open('wb'):
+                self.gulp_chunk._write_frame(0, b'\x01\x02')
+            self.assertFalse(imencode_mock.called)
+        self.assertEqual(b'\x01\x02\x00\x00', self.read_data_file())
+        expected = {'0': {'meta_data': [],
+                          'frame_info': {'loc': [0], 'pad': [2],
+                                         'length': [4]}}}
+        self.assertEqual(expected, self.gulp_chunk.meta_dict)
+
+    def test_encode_frame_encoded_bytes_without_encode_jpg(self):
+        self.gulp_chunk.encode_jpg = False
+        with self.assertRaises(ValueError):
+            self.gulp_chunk.encode_frame(b'\x01\x02')
+
+    def test_write_frame_append(self):
+        self.gulp_chunk.meta_dict = {}
+        with self.gulp_chunk.open('wb'):
+            self.gulp_chunk._write_frame(0, b'\x01\x02')
+        with self.gulp_chunk.open('ab'):
+            self.gulp_chunk._write_frame(0, b'\x03')
+        self.assertEqual(b'\x01\x02\x00\x00\x03\x00\x00\x00',
+                         self.read_data_file())
+        expected = {'0': {'meta_data': [],
+                          'frame_info': {'loc': [0, 4], 'pad': [2, 3],
+                                         'length': [4, 4]}}}
+        self.assertEqual(expected, self.gulp_chunk.meta_dict)
+
+    @mock.patch('gulpio.fileio._HAS_WRITEV', False)
+    def test_write_frame_without_writev(self):
+        self.gulp_chunk.meta_dict = OrderedDict()
+        with mock.patch('os.writev') as writev_mock:
+            with self.gulp_chunk.open('wb'):
+                self.gulp_chunk._write_frame(0, b'\x01')
+                self.gulp_chunk._write_frame(0, b'\x02\x03')
+            self.assertFalse(writev_mock.called)
+        self.assertEqual(b'\x01\x00\x00\x00\x02\x03\x00\x00',
+                         self.read_data_file())
+        self.assertEqual([0, 4],
+                         self.gulp_chunk.meta_dict['0']['frame_info']['loc'])
+
+    @unittest.skipIf(TurboJPEG is None, 'PyTurboJPEG not installed')
+    def test_write_frame_turbojpeg(self):
+        self.gulp_chunk.meta_dict = {}
+        self.gulp_chunk._tj = mock.Mock()
+        self.gulp_chunk._tj.encode.return_value = b'\x01'
+        image = np.ones((1, 1, 3), dtype='uint8')
+        with mock.patch('cv2.imencode') as imencode_mock:
+            with self.gulp_chunk.open('wb'):
+                self.gulp_chunk._write_frame(0, image)
+            self.assertFalse(imencode_mock.called)
+        self.assertEqual(b'\x01\x00\x00\x00', self.read_data_file())
+        self.assertEqual(1, self.gulp_chunk._tj.encode.call_count)
+
+    @unittest.skipIf(TurboJPEG is None, 'PyTurboJPEG not installed')
+    def test_encode_jpg_turbojpeg_single_channel(self):
+        from turbojpeg import TJPF_GRAY
+        self.gulp_chunk._tj = mock.Mock()
+        self.gulp_chunk._tj.encode.return_value = b'\x01'
+        image = np.ones((2, 2, 1), dtype='uint8')
+        with mock.patch('cv2.imencode') as imencode_mock:
+            self.assertEqual(b'\x01', self.gulp_chunk._encode_jpg(image))
+            self.assertFalse(imencode_mock.called)
+        args, kwargs = self.gulp_chunk._tj.encode.call_args
+        self.assertEqual((2, 2, 1), args[0].shape)
+        self.assertEqual(TJPF_GRAY, kwargs['pixel_format'])
+
+    @unittest.skipIf(TurboJPEG is None, 'PyTurboJPEG not installed')
+    def test_encode_jpg_turbojpeg_four_channels_uses_cv2(self):
+        self.gulp_chunk._tj = mock.Mock()
+        image = np.ones((2, 2, 4), dtype='uint8')
+        with mock.patch('cv2.imencode') as imencode_mock:
+            imencode_mock.return_value = True, np.ones((1,), dtype='uint8')
+            self.assertEqual(b'\x01', self.gulp_chunk._encode_jpg(image))
+        self.assertFalse(self.gulp_chunk._tj.encode.called)
+
+    @unittest.skipIf(TurboJPEG is None, 'PyTurboJPEG not installed')
+    def test_decode_jpg_turbojpeg(self):
+        from turbojpeg import TJPF_RGB, TJSAMP_420
+        image = np.ones((1, 1, 3), dtype='uint8')
+        self.gulp_chunk._tj = mock.Mock()
+        self.gulp_chunk._tj.decode_header.return_value = (1, 1, TJSAMP_420, 1)
+        self.gulp_chunk._tj.decode.return_value = image
+        with mock.patch('cv2.cvtColor') as cvtcolor_mock:
+            received = self.gulp_chunk._decode_jpg(b'ANY_JPEG')
+            self.assertFalse(cvtcolor_mock.called)
+        self.gulp_chunk._tj.decode.assert_called_once_with(
+            b'ANY_JPEG', pixel_format=TJPF_RGB)
+        npt.assert_array_equal(image, received)
+
+    def test_getstate_drops_turbojpeg(self):
+        self.gulp_chunk._tj = mock.Mock()
+        self.assertIsNone(self.gulp_chunk.__getstate__()['_tj'])
+
+    def test_getstate_drops_mmap(self):
+        self.gulp_chunk.mm = mock.Mock()
+        self.assertIsNone(self.gulp_chunk.__getstate__()['mm'])
+
     def test_get_frame_infos(self):
         self.gulp_chunk.meta_dict = {'0': {'meta_data': [{'meta': 'ANY_META'}],
-                                           'frame_info': [[1, 2, 3]]}}
+                                           'frame_info': {'loc': [1],
+                                                          'pad': [2],
+                                                          'length': [3]}}}
         with mock.patch('gulpio.fileio.GulpChunk.open'):
-            output = self.gulp_chunk._get_frame_infos('0')
-        expected = ([ImgInfo(loc=1, pad=2, length=3)], {'meta': 'ANY_META'})
-        self.assertEqual(expected, output)
+            img_info, meta = self.gulp_chunk._get_frame_infos('0')
+        self.assertIsInstance(img_info, ImgInfo)
+        npt.assert_array_equal([1], img_info.loc)
+        npt.assert_array_equal([2], img_info.pad)
+        npt.assert_array_equal([3], img_info.length)
+        self.assertEqual({'meta': 'ANY_META'}, meta)
 
     def test_contains(self):
         self.gulp_chunk.meta_dict = {'0': {'meta_data': [{}],
@@ -273,33 +509,85 @@ class TestGulpChunk(GulpChunkElement):
     def test_read_frames(self):
         # use 'write_frame' to write a single image
         self.gulp_chunk.meta_dict = OrderedDict()
-        self.gulp_chunk.fp = BytesIO()
         image = np.ones((3, 3, 3), dtype='uint8')
-        self.gulp_chunk._write_frame(0, image)
+        with self.gulp_chunk.open('wb'):
+            self.gulp_chunk._write_frame(0, image)
         self.gulp_chunk.meta_dict['0']['meta_data'].append({})
 
         # recover the single frame using 'read'
-        frames, meta = self.gulp_chunk.read_frames('0')
+        with self.gulp_chunk.open('rb'):
+            frames, meta = self.gulp_chunk.read_frames('0')
         npt.assert_array_equal(image, np.array(frames[0]))
         self.assertEqual({}, meta)
 
     def test_read_frames_fixed_length(self):
         # use 'write_frame' to write a single image
         self.gulp_chunk.meta_dict = OrderedDict()
-        self.gulp_chunk.fp = BytesIO()
         image = np.ones((1, 4), dtype='uint8')
+        self.gulp_chunk._tj = None
         with mock.patch('cv2.imencode') as imencode_mock:
             imencode_mock.return_value = '', np.ones((1, 4), dtype='uint8')
-            self.gulp_chunk._write_frame(0, image)
+            with self.gulp_chunk.open('wb'):
+                self.gulp_chunk._write_frame(0, image)
         self.gulp_chunk.meta_dict['0']['meta_data'].append({})
         with mock.patch('cv2.imdecode', lambda x, y:
                         np.array(x).reshape((1, 4))):
             with mock.patch('cv2.cvtColor', lambda x, y: x):
                 # recover the single frame using 'read'
-                frames, meta = self.gulp_chunk.read_frames('0')
+                with self.gulp_chunk.open('rb'):
+                    frames, meta = self.gulp_chunk.read_frames('0')
         npt.assert_array_equal(image, np.array(frames[0]))
         self.assertEqual({}, meta)
 
+    @mock.patch('gulpio.fileio.load_cuda_jpeg_decoder',
+                mock.Mock(return_value=None))
+    def test_read_frames_batch_without_cuda(self):
+        self.gulp_chunk.meta_dict = OrderedDict()
+        image = np.ones((3, 3, 3), dtype='uint8')
+        with self.gulp_chunk.open('wb'):
+            self.gulp_chunk._write_frame(0, image)
+            self.gulp_chunk._write_frame(0, image)
+        self.gulp_chunk.meta_dict['0']['meta_data'].append({})
+
+        with self.gulp_chunk.open('rb'):
+            frames, meta = self.gulp_chunk.read_frames_batch('0')
+        npt.assert_array_equal(np.stack([image, image]), frames)
+        self.assertEqual({}, meta)
+
+    @unittest.skipIf(TurboJPEG is None, 'PyTurboJPEG not installed')
+    @mock.patch('gulpio.fileio._TJ_DECODE_DST', True)
+    def test_read_frames_batch_turbojpeg(self):
+        from turbojpeg import TJPF_RGB, TJSAMP_420
+
+        def decode(img_str, pixel_format, dst):
+            dst[...] = 1
+            return dst
+        self.gulp_chunk._tj = mock.Mock()
+        self.gulp_chunk._tj.decode_header.return_value = (1, 2, TJSAMP_420, 1)
+        self.gulp_chunk._tj.decode.side_effect = decode
+        self.gulp_chunk._read_img_strs = mock.Mock(
+            return_value=([b'ANY_JPEG', b'ANY_JPEG'], {}))
+        frames, meta = self.gulp_chunk.read_frames_batch('0')
+        npt.assert_array_equal(np.ones((2, 2, 1, 3), dtype='uint8'), frames)
+        for _, kwargs in self.gulp_chunk._tj.decode.call_args_list:
+            self.assertEqual(TJPF_RGB, kwargs['pixel_format'])
+            self.assertTrue(np.shares_memory(frames, kwargs['dst']))
+
+    @unittest.skipIf(TurboJPEG is None, 'PyTurboJPEG not installed')
+    @mock.patch('gulpio.fileio._TJ_DECODE_DST', False)
+    def test_read_frames_batch_turbojpeg_without_dst(self):
+        from turbojpeg import TJSAMP_420
+        self.gulp_chunk._tj = mock.Mock()
+        self.gulp_chunk._tj.decode_header.return_value = (1, 2, TJSAMP_420, 1)
+        self.gulp_chunk._tj.decode.return_value = np.ones((2, 1, 3),
+                                                          dtype='uint8')
+        self.gulp_chunk._read_img_strs = mock.Mock(
+            return_value=([b'ANY_JPEG', b'ANY_JPEG'], {}))
+        frames, meta = self.gulp_chunk.read_frames_batch('0')
+        npt.assert_array_equal(np.ones((2, 2, 1, 3), dtype='uint8'), frames)
+        for _, kwargs in self.gulp_chunk._tj.decode.call_args_list:
+            self.assertNotIn('dst', kwargs)
+
     def test_iter(self):
         read_mock = mock.Mock()
         read_mock.return_value = [], []
@@ -308,7 +596,7 @@ class TestGulpChunk(GulpChunkElement):
                                                  ('2', {}),
                                                  ('3', {}),
                                                  ('4', {})))
-        self.gulp_chunk.read_frames = read_mock
+        self.gulp_chunk._read_img_strs = read_mock
         open_mock = mock.MagicMock()
         self.gulp_chunk.open = open_mock
 
@@ -327,8 +615,7 @@ class TestGulpChunk(GulpChunkElement):
                                                  ('2', {}),
                                                  ('3', {}),
                                                  ('4', {})))
-        self.gulp_chunk.read_frames = read_mock
-        self.gulp_chunk.read_frames = read_mock
+        self.gulp_chunk._read_img_strs = read_mock
         open_mock = mock.MagicMock()
         self.gulp_chunk.open = open_mock
 
@@ -370,6 +657,19 @@ class TestGulpChunk(GulpChunkElement):
             np.random.shuffle(ids)
             read_mock.assert_has_calls([mock.call(id_) for id_ in ids])
 
+    def test_iter_all_reads_ahead(self):
+        self.gulp_chunk.meta_dict = OrderedDict()
+        self.gulp_chunk.encode_jpg = False
+        frames = [np.array([i], dtype='int16') for i in range(3)]
+        with self.gulp_chunk.open('wb'):
+            for i, frame in enumerate(frames):
+                self.gulp_chunk.append(i, {'id': i}, [frame])
+        received = list(self.gulp_chunk.iter_all())
+        self.assertEqual([{'id': i} for i in range(3)],
+                         [meta for _, meta in received])
+        for frame, (item_frames, _) in zip(frames, received):
+            npt.assert_array_equal(frame, item_frames[0])
+
 
 class ChunkWriterElement(FSBase):
 
@@ -386,6 +686,7 @@ class TestChunkWriter(ChunkWriterElement):
     def test_initialization(self):
         self.assertEqual(self.adapter,
                          self.chunk_writer.adapter)
+        self.assertEqual(4, self.chunk_writer.frame_workers)
 
     @mock.patch('gulpio.fileio.GulpChunk')
     def test_write_chunk(self, mock_gulp):
@@ -395,10 +696,41 @@ class TestChunkWriter(ChunkWriterElement):
                    'frames': ['ANY_FRAME1', 'ANY_FRAME2'],
                    }
         self.adapter.iter_data = mock_iter_data
+        mock_gulp.encode_frame.side_effect = lambda frame: frame.encode()
         self.chunk_writer.write_chunk(mock_gulp, slice(0, 1))
+        mock_gulp.append.assert_called_once_with(
+            0, {'meta': 'ANY_META'}, [b'ANY_FRAME1', b'ANY_FRAME2'])
+
+    @mock.patch('gulpio.fileio.GulpChunk')
+    def test_write_chunk_single_frame_worker(self, mock_gulp):
+        def mock_iter_data(input_slice):
+            yield {'id': 0,
+                   'meta': {'meta': 'ANY_META'},
+                   'frames': ['ANY_FRAME1', 'ANY_FRAME2'],
+                   }
+        self.adapter.iter_data = mock_iter_data
+        ChunkWriter(self.adapter, frame_workers=1).write_chunk(mock_gulp,
+                                                               slice(0, 1))
+        self.assertFalse(mock_gulp.encode_frame.called)
         mock_gulp.append.assert_called_once_with(
             0, {'meta': 'ANY_META'}, ['ANY_FRAME1', 'ANY_FRAME2'])
 
+    def test_write_chunk_without_encode_jpg(self):
+        frames = [np.array([1, 2], dtype='int16'),
+                  np.array([3, 4], dtype='int16')]
+
+        def mock_iter_data(input_slice):
+            yield {'id': 0, 'meta': {}, 'frames': frames}
+        self.adapter.iter_data = mock_iter_data
+        gulp_chunk = GulpChunk(os.path.join(self.temp_dir, 'data_0.gulp'),
+                               os.path.join(self.temp_dir, 'meta_0.gmeta'),
+                               encode_jpg=False)
+        self.chunk_writer.write_chunk(gulp_chunk, slice(0, 1))
+        with gulp_chunk.open('rb'):
+            received, _ = gulp_chunk.read_frames('0')
+        for frame, received_frame in zip(frames, received):
+            npt.assert_array_equal(frame, received_frame)
+
 
 class GulpIngestorElement(FSBase):
 
@@ -425,26 +757,57 @@ class TestGulpIngestor(GulpIngestorElement):
         self.assertEqual(self.num_workers, self.gulp_ingestor.num_workers)
 
     @mock.patch('gulpio.fileio.ChunkWriter')
-    @mock.patch('gulpio.fileio.ProcessPoolExecutor')
+    @mock.patch('gulpio.fileio.get_context')
     def test_ingest(self,
-                    mock_process_pool,
+                    mock_get_context,
                     mock_chunk_writer,
                     ):
+        # a single worker writes the chunks in the current process
+        self.gulp_ingestor.adapter.__len__.return_value = 2
+        self.gulp_ingestor()
+        mock_chunk_writer.assert_called_once_with(self.adapter, 4)
+        self.assertFalse(mock_get_context.called)
+
+        write_chunk = mock_chunk_writer.return_value.write_chunk
+        self.assertEqual([slice(0, 1), slice(1, 2)],
+                         [c[0][1] for c in write_chunk.call_args_list])
+
+    @mock.patch('gulpio.fileio.ChunkWriter')
+    @mock.patch('gulpio.fileio.get_context')
+    def test_ingest_multiple_workers(self,
+                                     mock_get_context,
+                                     mock_chunk_writer,
+                                     ):
 
-        # The next three lines mock the ProcessPoolExecutor and it's map
+        # The next three lines mock the Pool and it's imap_unordered
         # function.
-        executor_mock = mock.Mock()
-        executor_mock.map.return_value = []
-        mock_process_pool.return_value.__enter__.return_value = executor_mock
+        pool_mock = mock.Mock()
+        pool_mock.imap_unordered.return_value = []
+        mock_pool = mock_get_context.return_value.Pool
+        mock_pool.return_value.__enter__.return_value = pool_mock
+        self.gulp_ingestor.num_workers = 2
+        self.gulp_ingestor.start_method = 'fork'
         self.gulp_ingestor.adapter.__len__.return_value = 2
         self.gulp_ingestor()
-        mock_chunk_writer.assert_called_once_with(self.adapter)
-
-        executor_mock.map.assert_called_once_with(
-            mock_chunk_writer.return_value.write_chunk,
-            mock.ANY,
-            [slice(0, 1), slice(1, 2)],
-        )
+        mock_chunk_writer.assert_called_once_with(self.adapter, 4)
+
+        mock_get_context.assert_called_once_with('fork')
+        mock_pool.assert_called_once_with(
+            2,
+            initializer=_init_worker,
+            initargs=(mock_chunk_writer.return_value,))
+        pool_mock.imap_unordered.assert_called_once_with(_write_chunk,
+                                                         mock.ANY)
+        chunks_and_slices = pool_mock.imap_unordered.call_args[0][1]
+        self.assertEqual([slice(0, 1), slice(1, 2)],
+                         [s for _, s in chunks_and_slices])
+
+    def test_write_chunk_in_worker(self):
+        chunk_writer = mock.Mock()
+        _init_worker(chunk_writer)
+        _write_chunk(('ANY_CHUNK', slice(0, 1)))
+        chunk_writer.write_chunk.assert_called_once_with('ANY_CHUNK',
+                                                         slice(0, 1))
 
 
 class DummyVideosAdapter(AbstractDatasetAdapter):
@@ -518,21 +881,21 @@ class TestGulpDirectory(FSBase):
         gulp_directory = GulpDirectory(output_directory)
         self.assertEqual(gulp_directory.output_dir, output_directory)
 
+        frame_info_1 = OrderedDict([('loc', [0, 632, 1264, 1896]),
+                                    ('pad', [1, 1, 1, 1]),
+                                    ('length', [632, 632, 632, 632])])
+        frame_info_2 = OrderedDict([('loc', [0, 632]),
+                                    ('pad', [1, 1]),
+                                    ('length', [632, 632])])
         expected_all_meta_dicts = [
             OrderedDict([('1',
-                         OrderedDict([('frame_info',
-                                      [[0, 1, 632],
-                                       [632, 1, 632],
-                                       [1264, 1, 632],
-                                       [1896, 1, 632]]),
+                         OrderedDict([('frame_info', frame_info_1),
                                       ('meta_data',
                                        [OrderedDict(
                                            [('name',
                                              'bunch of numpy arrays')])])]))]),
             OrderedDict([('2',
-                        OrderedDict([('frame_info',
-                                     [[0, 1, 632],
-                                      [632, 1, 632]]),
+                        OrderedDict([('frame_info', frame_info_2),
                                     ('meta_data',
                                      [OrderedDict(
                                         [('name', 'shorter_video')])])]))])]
@@ -542,18 +905,12 @@ class TestGulpDirectory(FSBase):
         self.assertEqual(gulp_directory.chunk_lookup, {'1': 0, '2': 1})
 
         expected_merged_meta_dict = {
-            '1': OrderedDict([('frame_info',
-                              [[0, 1, 632],
-                               [632, 1, 632],
-                               [1264, 1, 632],
-                               [1896, 1, 632]]),
+            '1': OrderedDict([('frame_info', frame_info_1),
                               ('meta_data',
                                [OrderedDict(
                                    [('name',
                                      'bunch of numpy arrays')])])]),
-            '2': OrderedDict([('frame_info',
-                              [[0, 1, 632],
-                               [632, 1, 632]]),
+            '2': OrderedDict([('frame_info', frame_info_2),
                               ('meta_data',
                                [OrderedDict([('name',
                                               'shorter_video')])])])}
@@ -611,6 +968,44 @@ class TestGulpDirectory(FSBase):
             self.assertEqual(expected_output_shapes,
                              [np.array(f).shape for f in frames])
 
+    def test_round_trip_multiple_workers(self):
+        adapter = RoundTripAdapter()
+        output_directory = os.path.join(self.temp_dir, "ANY_OUTPUT_DIR")
+        GulpIngestor(adapter, output_directory, 1, 2)()
+        gulp_directory = GulpDirectory(output_directory)
+        self.assertEqual({'1': 1, '2': 2}, gulp_directory.chunk_lookup)
+        received_frames, received_meta = gulp_directory[2]
+        self.assertEqual({'name': 'shorter_video'}, received_meta)
+        self.assertEqual([(4, 1, 3), (3, 1, 3)],
+                         [np.array(f).shape for f in received_frames])
+
+    def test_chunk_lookup_after_regulp(self):
+        output_directory = os.path.join(self.temp_dir, "ANY_OUTPUT_DIR")
+        GulpIngestor(RoundTripAdapter(), output_directory, 2, 1)()
+        GulpDirectory(output_directory)
+        shutil.rmtree(output_directory)
+        GulpIngestor(RoundTripAdapter(ids=[3, 4, 5]),
+                     output_directory, 2, 1)()
+        gulp_directory = GulpDirectory(output_directory)
+        self.assertEqual({'4': 0, '5': 1}, gulp_directory.chunk_lookup)
+        _, meta = gulp_directory[4]
+        self.assertEqual({'name': 'bunch of numpy arrays'}, meta)
+
+    def test_init_globs_once(self):
+        output_directory = os.path.join(self.temp_dir, "ANY_OUTPUT_DIR")
+        GulpIngestor(RoundTripAdapter(), output_directory, 2, 1)()
+        with mock.patch('glob.glob', wraps=glob.glob) as glob_mock:
+            gulp_directory = GulpDirectory(output_directory)
+        self.assertEqual(2, glob_mock.call_count)
+        self.assertEqual([0, 1], list(gulp_directory.chunk_objs_lookup))
+
+    def test_duplicate_ids(self):
+        output_directory = os.path.join(self.temp_dir, "ANY_OUTPUT_DIR")
+        GulpIngestor(RoundTripAdapter(), output_directory, 2, 1)()
+        GulpIngestor(RoundTripAdapter(), output_directory, 2, 1)()
+        with self.assertRaises(AssertionError):
+            GulpDirectory(output_directory)
+
     def test_random_access(self):
         # ingest dummy videos
         adapter = DummyVideosAdapter(num_videos=25)
@@ -630,3 +1025,115 @@ class TestGulpDirectory(FSBase):
                 img, meta = gulp_directory[id_]
                 # check the meta id match
                 self.assertEqual(meta['id'], id_)
+
+
+@unittest.skipIf(pa is None, 'pyarrow not installed')
+class TestArrowGulpChunk(FSBase):
+
+    def setUp(self):
+        super().setUp()
+        self.output_directory = os.path.join(self.temp_dir, "ANY_OUTPUT_DIR")
+
+    def ingest(self, num_workers=1):
+        GulpIngestor(RoundTripAdapter(), self.output_directory, 2,
+                     num_workers, chunk_class=ArrowGulpChunk)()
+        # the chunk class is chosen from the extension of the data files
+        return GulpDirectory(self.output_directory)
+
+    def test_round_trip(self):
+        gulp_directory = self.ingest()
+        gulp_chunk = next(gulp_directory.chunks())
+        self.assertIsInstance(gulp_chunk, ArrowGulpChunk)
+        self.assertEqual(
+            os.path.join(self.output_directory, 'data_0.arrow'),
+            gulp_chunk.data_file_path)
+        for frames, meta in gulp_chunk:
+            self.assertEqual({'name': 'bunch of numpy arrays'}, meta)
+            self.assertEqual([(4, 1, 3), (3, 1, 3), (2, 1, 3), (1, 1, 3)],
+                             [np.array(f).shape for f in frames])
+        received_frames, received_meta = gulp_directory[2, 1:]
+        self.assertEqual({'name': 'shorter_video'}, received_meta)
+        npt.assert_array_equal(np.ones((3, 1, 3), dtype='uint8'),
+                               received_frames[0])
+
+    def test_round_trip_multiple_workers(self):
+        gulp_directory = self.ingest(num_workers=2)
+        self.assertEqual({'1': 0, '2': 1}, gulp_directory.chunk_lookup)
+        received_frames, _ = gulp_directory[1]
+        self.assertEqual(4, len(received_frames))
+
+    def test_data_file_columns(self):
+        gulp_chunk = next(self.ingest().chunks())
+        table = pa.ipc.open_file(gulp_chunk.data_file_path).read_all()
+        self.assertEqual(['1'] * 4, table.column('id').to_pylist())
+        meta = table.column('meta').to_pylist()
+        self.assertEqual({'name': 'bunch of numpy arrays'},
+                         msgpack.unpackb(meta[0], raw=False))
+        self.assertEqual([None, None, None], meta[1:])
+        frame_info = gulp_chunk.meta_dict['1']['frame_info']
+        self.assertEqual([0, 1, 2, 3], frame_info['loc'])
+        self.assertEqual([0, 0, 0, 0], frame_info['pad'])
+        self.assertEqual([len(b) for b in
+                          table.column('jpeg_bytes').to_pylist()],
+                         frame_info['length'])
+
+    def test_mixed_directory(self):
+        self.ingest()
+        GulpIngestor(RoundTripAdapter(ids=[3, 4, 5]),
+                     self.output_directory, 2, 1)()
+        gulp_directory = GulpDirectory(self.output_directory)
+        self.assertEqual([ArrowGulpChunk, ArrowGulpChunk,
+                          GulpChunk, GulpChunk],
+                         [type(c) for c in gulp_directory.chunks()])
+        self.assertEqual(4, len(gulp_directory[1][0]))
+        self.assertEqual(4, len(gulp_directory[4][0]))
+
+    def test_many_items(self):
+        gulp_chunk = ArrowGulpChunk(
+            os.path.join(self.temp_dir, 'data_0.arrow'),
+            os.path.join(self.temp_dir, 'meta_0.gmeta'))
+        gulp_chunk.rows_per_batch = 64
+        with gulp_chunk.open('wb'):
+            for i in range(200):
+                gulp_chunk.append(i, {'id': i},
+                                  [bytes([i, j + 1]) for j in range(3)])
+        # rows are buffered into few, large record batches
+        reader = pa.ipc.open_file(gulp_chunk.data_file_path)
+        self.assertEqual([66] * 9 + [6],
+                         [reader.get_batch(i).num_rows
+                          for i in range(reader.num_record_batches)])
+
+        gulp_chunk = ArrowGulpChunk(gulp_chunk.data_file_path,
+                                    gulp_chunk.meta_file_path)
+        with mock.patch('pyarrow.ipc.open_file',
+                        wraps=pa.ipc.open_file) as open_file_mock:
+            for i in (150, 3, 199, 64):
+                with gulp_chunk.open('rb'):
+                    img_strs, meta = gulp_chunk._read_img_strs(str(i))
+                self.assertEqual({'id': i}, meta)
+                self.assertEqual([bytes([i, j + 1]) for j in range(3)],
+                                 [bytes(img_str) for img_str in img_strs])
+        # the data file is only mapped once while the chunk lives
+        self.assertEqual(1, open_file_mock.call_count)
+
+    def test_meta_data_like_meta_file(self):
+        gulp_chunk = ArrowGulpChunk(
+            os.path.join(self.temp_dir, 'data_0.arrow'),
+            os.path.join(self.temp_dir, 'meta_0.gmeta'))
+        meta_data = {'labels': {0: 'cat'}, 'score': np.float32(0.5)}
+        with gulp_chunk.open('wb'):
+            gulp_chunk.append(0, meta_data, [b'\x01'])
+        table = pa.ipc.open_file(gulp_chunk.data_file_path).read_all()
+        self.assertEqual(meta_data, msgpack_serializer.load(
+            gulp_chunk.meta_file_path)['0']['meta_data'][0])
+        self.assertEqual(meta_data, msgpack.unpackb(
+            table.column('meta')[0].as_py(), raw=False,
+            strict_map_key=False))
+
+    def test_open_with_ab(self):
+        gulp_chunk = ArrowGulpChunk(
+            os.path.join(self.temp_dir, 'ANY_DATA_FILE_PATH'),
+            os.path.join(self.temp_dir, 'ANY_META_FILE_PATH'))
+        with self.assertRaises(NotImplementedError):
+            with gulp_chunk.open('ab'):
+                pass
@@ -17,6 +17,7 @@ from gulpio.sanity_utils import (check_meta_file_size_larger_zero,
                                  get_duplicate_entries,
                                  check_for_failures,
                                  )
+from gulpio.fileio import ArrowGulpChunk, GulpDirectory, pa
 
 
 class FSBase(unittest.TestCase):
@@ -115,9 +116,11 @@ class TestCheckDataFileSize(FSBase):
         gulp_directory.chunks.return_value = [chunk]
         chunk.meta_dict = OrderedDict(
             [("0", {"meta_data": [{"ANY0": "META0"}],
-                    "frame_info": [[0, 1, 2], [2, 1, 2]]}),
+                    "frame_info": {"loc": [0, 2], "pad": [1, 1],
+                                   "length": [2, 2]}}),
              ("1", {"meta_data": [{"ANY1": "META1"}],
-                    "frame_info": [[4, 2, 2], [8, 1, 2]]})])
+                    "frame_info": {"loc": [4, 8], "pad": [2, 1],
+                                   "length": [2, 2]}})])
         data_file_path = os.path.join(self.temp_dir, "10BYTES")
         with open(data_file_path, 'wb') as f:
             f.write(b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09')
@@ -131,7 +134,8 @@ class TestCheckDataFileSize(FSBase):
         gulp_directory.chunks.return_value = [chunk]
         chunk.meta_dict = OrderedDict(
             [("0", {"meta_data": [{"ANY0": "META0"}],
-                    "frame_info": [[0, 1, 2], [2, 1, 2]]})])
+                    "frame_info": {"loc": [0, 2], "pad": [1, 1],
+                                   "length": [2, 2]}})])
         data_file_path = os.path.join(self.temp_dir, "10BYTES")
         with open(data_file_path, 'wb') as f:
             f.write(b'\x00')
@@ -139,6 +143,22 @@ class TestCheckDataFileSize(FSBase):
         result = check_data_file_size(gulp_directory)
         self.assertEqual([data_file_path], result)
 
+    @unittest.skipIf(pa is None, 'pyarrow not installed')
+    def test_arrow_data_file_size(self):
+        output_directory = os.path.join(self.temp_dir, "ANY_OUTPUT_DIR")
+        gulp_directory = GulpDirectory(output_directory,
+                                       chunk_class=ArrowGulpChunk)
+        os.makedirs(output_directory)
+        gulp_chunk = next(gulp_directory.new_chunks(1))
+        with gulp_chunk.open('wb'):
+            gulp_chunk.append(0, {}, [b'\x01', b'\x02\x03'])
+        gulp_directory = GulpDirectory(output_directory)
+        self.assertEqual([], check_data_file_size(gulp_directory))
+        gulp_chunk = next(gulp_directory.chunks())
+        gulp_chunk.meta_dict['0']['frame_info']['loc'].append(2)
+        self.assertEqual([gulp_chunk.data_file_path],
+                         check_data_file_size(gulp_directory))
+
 
 class TestCheckForDuplicateIds(unittest.TestCase):
 
@@ -93,6 +93,27 @@ class TestResizeImages(unittest.TestCase):
                          received)
 
 
+class TestResizeImagesKeepJpg(FSBase):
+
+    def test_keep_jpg(self):
+        jpg_path = os.path.join(self.temp_dir, 'ANY_IMAGE.jpg')
+        with open(jpg_path, 'wb') as fp:
+            fp.write(b'ANY_JPEG_BYTES')
+        with mock.patch('cv2.imread') as mock_imread:
+            received = list(resize_images([jpg_path], keep_jpg=True))
+            self.assertFalse(mock_imread.called)
+        self.assertEqual([b'ANY_JPEG_BYTES'], received)
+
+    @mock.patch('cv2.imread')
+    @mock.patch('gulpio.utils.resize_by_short_edge')
+    def test_keep_jpg_with_resize(self, mock_resize, mock_imread):
+        mock_imread.return_value = 'READ_IMAGE'
+        mock_resize.return_value = 'RESIZED_IMAGE'
+        received = list(resize_images(['ANY_IMAGE.jpg'], img_size=1,
+                                      keep_jpg=True))
+        self.assertEqual(['RESIZED_IMAGE'], received)
+
+
 class TestResizeByShortEdge(unittest.TestCase):
 
     def test_resize_first_edge_shorter(self):